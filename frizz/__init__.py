@@ -1,5 +1,6 @@
 from frizz._internal.agent import Agent
+from frizz._internal.cache import ResponseCache
 from frizz._internal.tools import Tool, tool
 from frizz._internal.types.response import StepResult
 
-__all__ = ["Agent", "tool", "Tool", "StepResult"]
+__all__ = ["Agent", "tool", "Tool", "StepResult", "ResponseCache"]
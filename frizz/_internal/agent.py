@@ -1,24 +1,37 @@
-from functools import cached_property
-from typing import Any
+import asyncio
+import logging
+import random
+from asyncio import sleep
+from typing import Any, Literal, overload
 
 from pydantic import BaseModel, ValidationError
 
 from aikernel import (
     Conversation,
     LLMAssistantMessage,
+    LLMAutoToolResponse,
     LLMMessagePart,
     LLMModelName,
+    LLMRequiredToolResponse,
     LLMRouter,
     LLMSystemMessage,
+    LLMTool,
     LLMToolMessage,
     LLMToolMessageFunctionCall,
     LLMUserMessage,
     llm_tool_call,
 )
+from aikernel.errors import RateLimitExceededError
+from frizz._internal.cache import ResponseCache
 from frizz._internal.tools import Tool
 from frizz._internal.types.response import StepResult
 from frizz.errors import FrizzError
 
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_BACKOFF_BASE_SECONDS = 1.0
+RATE_LIMIT_BACKOFF_CAP_SECONDS = 30.0
+
 
 class Agent[ContextT]:
     def __init__(
@@ -28,9 +41,15 @@ class Agent[ContextT]:
         context: ContextT,
         system_message: LLMSystemMessage | None = None,
         conversation_dump: str | None = None,
+        cache: ResponseCache | None = None,
+        max_rate_limit_retries: int = 5,
     ) -> None:
-        self._tools = tools
+        self._tools = list(tools)
         self._context = context
+        self._cache = cache
+        self._max_rate_limit_retries = max_rate_limit_retries
+        self._tools_by_name: dict[str, Tool[ContextT, BaseModel, BaseModel]] = {tool.name: tool for tool in self._tools}
+        self._llm_tools: list[LLMTool[Any]] = [tool.as_llm_tool() for tool in self._tools]
         self._conversation = (
             Conversation.load(dump=conversation_dump) if conversation_dump is not None else Conversation()
         )
@@ -41,18 +60,23 @@ class Agent[ContextT]:
     def conversation(self) -> Conversation:
         return self._conversation
 
-    @cached_property
+    @property
     def tools_by_name(self) -> dict[str, Tool[ContextT, BaseModel, BaseModel]]:
-        return {tool.name: tool for tool in self._tools}
+        return self._tools_by_name
+
+    @property
+    def llm_tools(self) -> list[LLMTool[Any]]:
+        return self._llm_tools
 
     async def step(self, *, user_message: LLMUserMessage, router: LLMRouter[LLMModelName]) -> StepResult:
         with self.conversation.session():
             self._conversation.add_user_message(message=user_message)
+            messages = self._conversation.render()
 
-            agent_response = await llm_tool_call(
-                messages=self._conversation.render(),
+            agent_response = await self._tool_call(
+                messages=messages,
                 router=router,
-                tools=[tool.as_llm_tool() for tool in self._tools],
+                tools=self.llm_tools,
                 tool_choice="auto",
             )
 
@@ -65,17 +89,30 @@ class Agent[ContextT]:
                 if chosen_tool is None:
                     raise FrizzError(f"Tool {agent_response.tool_call.tool_name} not found")
 
-                parameters_response = await llm_tool_call(
-                    messages=self._conversation.render(),
-                    router=router,
-                    tools=[chosen_tool.as_llm_tool()],
-                    tool_choice="required",
-                )
-
+                tool_call = agent_response.tool_call
                 try:
-                    parameters = chosen_tool.parameters_model.model_validate(parameters_response.tool_call.arguments)
+                    parameters = chosen_tool.validate_parameters(arguments=tool_call.arguments)
                 except ValidationError as error:
-                    raise FrizzError(f"Invalid tool parameters for tool {agent_response.tool_call.tool_name}: {error}")
+                    logger.debug(
+                        "Inline arguments for tool %s failed validation, requesting them again: %s",
+                        tool_call.tool_name,
+                        error,
+                    )
+                    parameters = None
+
+                if parameters is None:
+                    parameters_response = await self._tool_call(
+                        messages=messages,
+                        router=router,
+                        tools=[chosen_tool.as_llm_tool()],
+                        tool_choice="required",
+                    )
+                    tool_call = parameters_response.tool_call
+
+                    try:
+                        parameters = chosen_tool.validate_parameters(arguments=tool_call.arguments)
+                    except ValidationError as error:
+                        raise FrizzError(f"Invalid tool parameters for tool {tool_call.tool_name}: {error}")
 
                 try:
                     result = await chosen_tool(
@@ -84,15 +121,15 @@ class Agent[ContextT]:
                         conversation=self._conversation,
                     )
                 except Exception as error:
-                    raise FrizzError(f"Error calling tool {agent_response.tool_call.tool_name}: {error}")
+                    raise FrizzError(f"Error calling tool {tool_call.tool_name}: {error}")
 
                 tool_message = LLMToolMessage(
-                    tool_call_id=parameters_response.tool_call.id,
-                    name=parameters_response.tool_call.tool_name,
+                    tool_call_id=tool_call.id,
+                    name=tool_call.tool_name,
                     response=result.model_dump(),
                     function_call=LLMToolMessageFunctionCall(
-                        name=parameters_response.tool_call.tool_name,
-                        arguments=parameters_response.tool_call.arguments,
+                        name=tool_call.tool_name,
+                        arguments=tool_call.arguments,
                     ),
                 )
                 self._conversation.add_tool_message(tool_message=tool_message)
@@ -101,3 +138,118 @@ class Agent[ContextT]:
                 raise RuntimeError("Not a possible state, validated by Pydantic")
 
         return StepResult(assistant_message=assistant_message, tool_message=tool_message)
+
+    async def step_many(
+        self,
+        *,
+        user_messages: list[LLMUserMessage],
+        router: LLMRouter[LLMModelName],
+        max_concurrency: int = 8,
+    ) -> list[StepResult]:
+        """Step an independent fork of the current conversation for each user message, concurrently.
+
+        Forks copy the conversation but share this agent's context object, so tools run against it
+        concurrently; the context must be safe for concurrent use. If any fork fails, the rest are cancelled
+        and the error is re-raised.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def step_fork(user_message: LLMUserMessage) -> StepResult:
+            fork = self._fork()
+            async with semaphore:
+                return await fork.step(user_message=user_message, router=router)
+
+        tasks = [asyncio.create_task(step_fork(user_message)) for user_message in user_messages]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _fork(self) -> "Agent[ContextT]":
+        fork = Agent(
+            tools=self._tools,
+            context=self._context,
+            cache=self._cache,
+            max_rate_limit_retries=self._max_rate_limit_retries,
+        )
+
+        # messages are shared, only the system message is copied since the conversation mutates it in place
+        if self._conversation.system_message is not None:
+            fork._conversation.set_system_message(message=self._conversation.system_message.model_copy(deep=True))
+        for user_message in self._conversation.user_messages:
+            fork._conversation.add_user_message(message=user_message)
+        for assistant_message in self._conversation.assistant_messages:
+            fork._conversation.add_assistant_message(message=assistant_message)
+        for tool_message in self._conversation.tool_messages:
+            fork._conversation.add_tool_message(tool_message=tool_message)
+
+        return fork
+
+    @overload
+    async def _tool_call(
+        self,
+        *,
+        messages: list[LLMSystemMessage | LLMUserMessage | LLMAssistantMessage | LLMToolMessage],
+        router: LLMRouter[LLMModelName],
+        tools: list[LLMTool[Any]],
+        tool_choice: Literal["auto"],
+    ) -> LLMAutoToolResponse: ...
+    @overload
+    async def _tool_call(
+        self,
+        *,
+        messages: list[LLMSystemMessage | LLMUserMessage | LLMAssistantMessage | LLMToolMessage],
+        router: LLMRouter[LLMModelName],
+        tools: list[LLMTool[Any]],
+        tool_choice: Literal["required"],
+    ) -> LLMRequiredToolResponse: ...
+
+    async def _tool_call(
+        self,
+        *,
+        messages: list[LLMSystemMessage | LLMUserMessage | LLMAssistantMessage | LLMToolMessage],
+        router: LLMRouter[LLMModelName],
+        tools: list[LLMTool[Any]],
+        tool_choice: Literal["auto", "required"],
+    ) -> LLMAutoToolResponse | LLMRequiredToolResponse:
+        if self._cache is None:
+            return await self._llm_tool_call(messages=messages, router=router, tools=tools, tool_choice=tool_choice)
+
+        key = ResponseCache.key(model=router.primary_model, messages=messages, tools=tools, tool_choice=tool_choice)
+        cached_response = self._cache.get(key=key)
+        if cached_response is not None:
+            return cached_response
+
+        response = await self._llm_tool_call(messages=messages, router=router, tools=tools, tool_choice=tool_choice)
+        self._cache.set(key=key, response=response)
+
+        return response
+
+    async def _llm_tool_call(
+        self,
+        *,
+        messages: list[LLMSystemMessage | LLMUserMessage | LLMAssistantMessage | LLMToolMessage],
+        router: LLMRouter[LLMModelName],
+        tools: list[LLMTool[Any]],
+        tool_choice: Literal["auto", "required"],
+    ) -> LLMAutoToolResponse | LLMRequiredToolResponse:
+        attempt = 0
+        while True:
+            try:
+                return await llm_tool_call(messages=messages, router=router, tools=tools, tool_choice=tool_choice)
+            except RateLimitExceededError:
+                if attempt >= self._max_rate_limit_retries:
+                    raise
+
+                backoff = min(RATE_LIMIT_BACKOFF_CAP_SECONDS, RATE_LIMIT_BACKOFF_BASE_SECONDS * 2**attempt)
+                logger.debug(
+                    "Rate limited by %s, retrying in %.1fs (attempt %d)", router.primary_model, backoff, attempt + 1
+                )
+                await sleep(backoff + random.uniform(0, 0.1))
+                attempt += 1
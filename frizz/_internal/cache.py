@@ -0,0 +1,78 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Literal
+
+from aikernel import (
+    LiteLLMMessage,
+    LLMAssistantMessage,
+    LLMAutoToolResponse,
+    LLMModelName,
+    LLMRequiredToolResponse,
+    LLMSystemMessage,
+    LLMTool,
+    LLMToolMessage,
+    LLMUserMessage,
+)
+
+
+class ResponseCache:
+    """Exact-match cache of llm_tool_call responses.
+
+    Keys hash the model, rendered messages, rendered tools, and tool choice, so computing one renders the
+    conversation again on top of aikernel's own render inside llm_tool_call; that cost is accepted in exchange
+    for skipping the network call on a hit. The caller owns the cache's lifetime: without `max_entries` it grows
+    with every distinct prompt, with it the least recently used entries are evicted.
+    """
+
+    def __init__(self, *, max_entries: int | None = None) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self._max_entries = max_entries
+        self._responses: OrderedDict[str, LLMAutoToolResponse | LLMRequiredToolResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    @staticmethod
+    def key(
+        *,
+        model: LLMModelName,
+        messages: list[LLMSystemMessage | LLMUserMessage | LLMAssistantMessage | LLMToolMessage],
+        tools: list[LLMTool[Any]],
+        tool_choice: Literal["auto", "required"],
+    ) -> str:
+        rendered_messages: list[LiteLLMMessage] = []
+        for message in messages:
+            if isinstance(message, LLMToolMessage):
+                rendered_messages.extend(message.render_call_and_response())
+            else:
+                rendered_messages.append(message.render())
+
+        payload = {
+            "model": model,
+            "messages": rendered_messages,
+            "tools": [tool.render() for tool in tools],
+            "tool_choice": tool_choice,
+        }
+        serialized = json.dumps(payload, sort_keys=True, default=str).encode()
+
+        return hashlib.blake2b(serialized, digest_size=16).hexdigest()
+
+    def get(self, *, key: str) -> LLMAutoToolResponse | LLMRequiredToolResponse | None:
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+
+        return response
+
+    def set(self, *, key: str, response: LLMAutoToolResponse | LLMRequiredToolResponse) -> None:
+        self._responses[key] = response
+        self._responses.move_to_end(key)
+
+        if self._max_entries is not None and len(self._responses) > self._max_entries:
+            self._responses.popitem(last=False)
+
+    def clear(self) -> None:
+        self._responses.clear()
@@ -1,9 +1,10 @@
+import copy
 from collections.abc import Callable
-from typing import Protocol, get_type_hints
+from typing import Any, Protocol, get_type_hints
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
 
-from aikernel import Conversation, LLMTool
+from aikernel import Conversation, LiteLLMTool, LLMTool
 
 
 class IToolFn[ContextT, ParametersT: BaseModel, ReturnT](Protocol):
@@ -12,7 +13,27 @@ class IToolFn[ContextT, ParametersT: BaseModel, ReturnT](Protocol):
     async def __call__(self, *, context: ContextT, parameters: ParametersT, conversation: Conversation) -> ReturnT: ...
 
 
+class _SchemaCachedLLMTool[ParametersT: BaseModel](LLMTool[ParametersT]):
+    _parameters_schema: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._parameters_schema = self.parameters.model_json_schema()
+
+    def render(self) -> LiteLLMTool:
+        # providers may rewrite the schema in place, so each render gets its own copy
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": copy.deepcopy(self._parameters_schema),
+            },
+        }
+
+
 class Tool[ContextT, ParametersT: BaseModel, ReturnT: BaseModel]:
+    __slots__ = ("_fn", "_name", "_parameters_model", "_parameters_adapter", "_llm_tool", "__weakref__")
+
     def __init__(
         self,
         fn: IToolFn[ContextT, ParametersT, ReturnT],
@@ -22,6 +43,9 @@ class Tool[ContextT, ParametersT: BaseModel, ReturnT: BaseModel]:
     ) -> None:
         self._fn = fn
         self._name = name
+        self._parameters_model: type[ParametersT] | None = None
+        self._parameters_adapter: TypeAdapter[ParametersT] | None = None
+        self._llm_tool: LLMTool[ParametersT] | None = None
 
     @property
     def name(self) -> str:
@@ -33,18 +57,33 @@ class Tool[ContextT, ParametersT: BaseModel, ReturnT: BaseModel]:
 
     @property
     def parameters_model(self) -> type[ParametersT]:
+        if self._parameters_model is not None:
+            return self._parameters_model
+
         type_hints = get_type_hints(self._fn)
         parameters_type_hint = type_hints.get("parameters")
 
         if parameters_type_hint is not None:
+            self._parameters_model = parameters_type_hint
             return parameters_type_hint
         else:
             raise TypeError(
                 "Invalid type signature for Tool; `use` method must have a single `parameters` parameter with a Pydantic model type"
             )
 
+    def validate_parameters(self, *, arguments: dict[str, Any]) -> ParametersT:
+        if self._parameters_adapter is None:
+            self._parameters_adapter = TypeAdapter(self.parameters_model)
+
+        return self._parameters_adapter.validate_python(arguments)
+
     def as_llm_tool(self) -> LLMTool[ParametersT]:
-        return LLMTool(name=self.name, description=self.description, parameters=self.parameters_model)
+        if self._llm_tool is None:
+            self._llm_tool = _SchemaCachedLLMTool(
+                name=self.name, description=self.description, parameters=self.parameters_model
+            )
+
+        return self._llm_tool
 
     async def __call__(self, *, context: ContextT, parameters: ParametersT, conversation: Conversation) -> ReturnT:
         return await self._fn(context=context, parameters=parameters, conversation=conversation)
@@ -0,0 +1,237 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+from pytest_mock import MockerFixture
+
+from aikernel import (
+    Conversation,
+    LLMAutoToolResponse,
+    LLMMessagePart,
+    LLMModelName,
+    LLMRequiredToolResponse,
+    LLMResponseToolCall,
+    LLMResponseUsage,
+    LLMUserMessage,
+)
+from aikernel.errors import RateLimitExceededError
+from frizz import Agent, ResponseCache, Tool, tool
+
+
+class EchoParams(BaseModel):
+    text: str
+
+
+class EchoResult(BaseModel):
+    echoed: str
+
+
+@tool(name="echo")
+async def echo(*, context: None, parameters: EchoParams, conversation: Conversation) -> EchoResult:
+    """Echo the provided text back."""
+    return EchoResult(echoed=parameters.text)
+
+
+USAGE = LLMResponseUsage(input_tokens=1, output_tokens=1)
+
+
+def text_response(text: str) -> LLMAutoToolResponse:
+    return LLMAutoToolResponse(text=text, model=LLMModelName.GEMINI_20_FLASH, usage=USAGE)
+
+
+def tool_response(arguments: dict[str, Any], *, required: bool = False) -> Any:
+    tool_call = LLMResponseToolCall(id="call_1", tool_name="echo", arguments=arguments)
+    if required:
+        return LLMRequiredToolResponse(tool_call=tool_call, model=LLMModelName.GEMINI_20_FLASH, usage=USAGE)
+    return LLMAutoToolResponse(tool_call=tool_call, model=LLMModelName.GEMINI_20_FLASH, usage=USAGE)
+
+
+def user_message(text: str) -> LLMUserMessage:
+    return LLMUserMessage(parts=[LLMMessagePart(content=text)])
+
+
+@pytest.fixture
+def router() -> MagicMock:
+    router = MagicMock()
+    router.primary_model = LLMModelName.GEMINI_20_FLASH
+    return router
+
+
+async def test_step_returns_assistant_message(mocker: MockerFixture, router: MagicMock) -> None:
+    mocker.patch("frizz._internal.agent.llm_tool_call", AsyncMock(return_value=text_response("hello")))
+    agent = Agent(tools=[echo], context=None)
+
+    result = await agent.step(user_message=user_message("hi"), router=router)
+
+    assert result.assistant_message is not None
+    assert result.assistant_message.parts[0].content == "hello"
+    assert result.tool_message is None
+
+
+async def test_step_calls_tool_with_inline_arguments(mocker: MockerFixture, router: MagicMock) -> None:
+    llm_tool_call = mocker.patch(
+        "frizz._internal.agent.llm_tool_call", AsyncMock(return_value=tool_response({"text": "ping"}))
+    )
+    agent = Agent(tools=[echo], context=None)
+
+    result = await agent.step(user_message=user_message("echo ping"), router=router)
+
+    assert result.tool_message is not None
+    assert result.tool_message.response == {"echoed": "ping"}
+    assert len(agent.conversation.tool_messages) == 1
+    assert llm_tool_call.await_count == 1
+
+
+async def test_step_requests_arguments_when_inline_arguments_invalid(mocker: MockerFixture, router: MagicMock) -> None:
+    llm_tool_call = mocker.patch(
+        "frizz._internal.agent.llm_tool_call",
+        AsyncMock(side_effect=[tool_response({}), tool_response({"text": "ping"}, required=True)]),
+    )
+    agent = Agent(tools=[echo], context=None)
+
+    result = await agent.step(user_message=user_message("echo ping"), router=router)
+
+    assert result.tool_message is not None
+    assert result.tool_message.response == {"echoed": "ping"}
+    assert llm_tool_call.await_count == 2
+    assert llm_tool_call.await_args_list[1].kwargs["tool_choice"] == "required"
+
+
+async def test_argument_request_failure_is_not_chained_to_validation_error(
+    mocker: MockerFixture, router: MagicMock
+) -> None:
+    rate_limited = RateLimitExceededError(model_name=LLMModelName.GEMINI_20_FLASH)
+    mocker.patch("frizz._internal.agent.llm_tool_call", AsyncMock(side_effect=[tool_response({}), rate_limited]))
+    agent = Agent(tools=[echo], context=None, max_rate_limit_retries=0)
+
+    with pytest.raises(RateLimitExceededError) as error:
+        await agent.step(user_message=user_message("echo ping"), router=router)
+
+    assert error.value.__context__ is None
+
+
+async def test_cache_skips_repeated_llm_calls(mocker: MockerFixture, router: MagicMock) -> None:
+    llm_tool_call = mocker.patch("frizz._internal.agent.llm_tool_call", AsyncMock(return_value=text_response("hello")))
+    cache = ResponseCache()
+
+    for _ in range(2):
+        agent = Agent(tools=[echo], context=None, cache=cache)
+        await agent.step(user_message=user_message("hi"), router=router)
+
+    assert llm_tool_call.await_count == 1
+    assert len(cache) == 1
+
+
+async def test_step_many_runs_independent_forks(mocker: MockerFixture, router: MagicMock) -> None:
+    mocker.patch(
+        "frizz._internal.agent.llm_tool_call",
+        AsyncMock(side_effect=[text_response("one"), text_response("two"), text_response("three")]),
+    )
+    agent = Agent(tools=[echo], context=None)
+
+    results = await agent.step_many(
+        user_messages=[user_message("a"), user_message("b"), user_message("c")], router=router, max_concurrency=2
+    )
+
+    assert [result.assistant_message.parts[0].content for result in results if result.assistant_message] == [
+        "one",
+        "two",
+        "three",
+    ]
+    assert agent.conversation.user_messages == []
+
+
+async def test_step_many_forks_share_prior_history(mocker: MockerFixture, router: MagicMock) -> None:
+    llm_tool_call = mocker.patch("frizz._internal.agent.llm_tool_call", AsyncMock(return_value=text_response("ok")))
+    agent = Agent(tools=[echo], context=None)
+    await agent.step(user_message=user_message("first"), router=router)
+
+    await agent.step_many(user_messages=[user_message("a"), user_message("b")], router=router)
+
+    for call in llm_tool_call.await_args_list[1:]:
+        assert call.kwargs["messages"][0].parts[0].content == "first"
+        assert len(call.kwargs["messages"]) == 3
+    assert len(agent.conversation.user_messages) == 1
+
+
+async def test_step_many_cancels_remaining_forks_on_failure(mocker: MockerFixture, router: MagicMock) -> None:
+    async def slow_llm_tool_call(**kwargs: Any) -> LLMAutoToolResponse:
+        await asyncio.sleep(0.001)
+        if llm_tool_call.await_count == 1:
+            raise RateLimitExceededError(model_name=LLMModelName.GEMINI_20_FLASH)
+        return text_response("ok")
+
+    llm_tool_call = mocker.patch("frizz._internal.agent.llm_tool_call", AsyncMock(side_effect=slow_llm_tool_call))
+    agent = Agent(tools=[echo], context=None, max_rate_limit_retries=0)
+
+    with pytest.raises(RateLimitExceededError):
+        await agent.step_many(
+            user_messages=[user_message("a"), user_message("b"), user_message("c"), user_message("d")],
+            router=router,
+            max_concurrency=1,
+        )
+    calls_at_failure = llm_tool_call.await_count
+    await asyncio.sleep(0.01)
+
+    assert llm_tool_call.await_count == calls_at_failure
+    assert calls_at_failure < 4
+
+
+async def test_step_many_rejects_non_positive_concurrency(router: MagicMock) -> None:
+    agent = Agent(tools=[echo], context=None)
+
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(agent.step_many(user_messages=[user_message("a")], router=router, max_concurrency=0), 1)
+
+
+async def test_rate_limited_calls_are_retried_with_backoff(mocker: MockerFixture, router: MagicMock) -> None:
+    rate_limited = RateLimitExceededError(model_name=LLMModelName.GEMINI_20_FLASH)
+    mocker.patch(
+        "frizz._internal.agent.llm_tool_call",
+        AsyncMock(side_effect=[rate_limited, rate_limited, text_response("hello")]),
+    )
+    sleep = mocker.patch("frizz._internal.agent.sleep", AsyncMock())
+    agent = Agent(tools=[echo], context=None)
+
+    result = await agent.step(user_message=user_message("hi"), router=router)
+
+    assert result.assistant_message is not None
+    assert sleep.await_count == 2
+    assert 2.0 <= sleep.await_args_list[1].args[0] < 2.1
+
+
+async def test_rate_limit_error_raised_after_max_retries(mocker: MockerFixture, router: MagicMock) -> None:
+    rate_limited = RateLimitExceededError(model_name=LLMModelName.GEMINI_20_FLASH)
+    llm_tool_call = mocker.patch("frizz._internal.agent.llm_tool_call", AsyncMock(side_effect=rate_limited))
+    mocker.patch("frizz._internal.agent.sleep", AsyncMock())
+    agent = Agent(tools=[echo], context=None, max_rate_limit_retries=1)
+
+    with pytest.raises(RateLimitExceededError):
+        await agent.step(user_message=user_message("hi"), router=router)
+
+    assert llm_tool_call.await_count == 2
+    assert agent.conversation.user_messages == []
+
+
+def test_agent_construction_rejects_tool_without_parameters_model() -> None:
+    async def untyped(*, context: None, parameters, conversation: Conversation) -> EchoResult:  # type: ignore
+        return EchoResult(echoed="")
+
+    with pytest.raises(TypeError):
+        Agent(tools=[Tool(untyped)], context=None)  # type: ignore
+
+
+async def test_agent_snapshots_tools_at_construction(mocker: MockerFixture, router: MagicMock) -> None:
+    llm_tool_call = mocker.patch(
+        "frizz._internal.agent.llm_tool_call", AsyncMock(return_value=tool_response({"text": "ping"}))
+    )
+    tools = [echo]
+    agent = Agent(tools=tools, context=None)
+    tools.clear()
+
+    result = await agent.step(user_message=user_message("echo ping"), router=router)
+
+    assert result.tool_message is not None
+    assert [llm_tool.name for llm_tool in llm_tool_call.await_args_list[0].kwargs["tools"]] == ["echo"]
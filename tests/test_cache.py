@@ -0,0 +1,38 @@
+import pytest
+
+from aikernel import LLMAutoToolResponse, LLMModelName, LLMResponseUsage
+from frizz import ResponseCache
+
+
+def response(text: str) -> LLMAutoToolResponse:
+    return LLMAutoToolResponse(
+        text=text, model=LLMModelName.GEMINI_20_FLASH, usage=LLMResponseUsage(input_tokens=1, output_tokens=1)
+    )
+
+
+def test_unbounded_cache_keeps_every_entry() -> None:
+    cache = ResponseCache()
+
+    for index in range(10):
+        cache.set(key=str(index), response=response(str(index)))
+
+    assert len(cache) == 10
+
+
+def test_bounded_cache_evicts_least_recently_used() -> None:
+    cache = ResponseCache(max_entries=2)
+    cache.set(key="a", response=response("a"))
+    cache.set(key="b", response=response("b"))
+
+    assert cache.get(key="a") is not None
+    cache.set(key="c", response=response("c"))
+
+    assert len(cache) == 2
+    assert cache.get(key="b") is None
+    assert cache.get(key="a") is not None
+    assert cache.get(key="c") is not None
+
+
+def test_max_entries_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        ResponseCache(max_entries=0)
@@ -0,0 +1,74 @@
+import weakref
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from aikernel import Conversation
+from frizz import Tool, tool
+
+
+class AddParams(BaseModel):
+    a: int
+    b: int
+
+
+class AddResult(BaseModel):
+    total: int
+
+
+@tool(name="add")
+async def add(*, context: None, parameters: AddParams, conversation: Conversation) -> AddResult:
+    """Add two integers."""
+    return AddResult(total=parameters.a + parameters.b)
+
+
+def test_tool_metadata() -> None:
+    assert add.name == "add"
+    assert add.description == "Add two integers."
+    assert add.parameters_model is AddParams
+
+
+def test_tool_has_no_instance_dict() -> None:
+    assert not hasattr(add, "__dict__")
+
+
+def test_tool_supports_weak_references() -> None:
+    assert weakref.ref(add)() is add
+
+
+def test_as_llm_tool_is_memoized() -> None:
+    llm_tool = add.as_llm_tool()
+
+    assert llm_tool is add.as_llm_tool()
+    assert llm_tool.name == "add"
+    assert llm_tool.parameters is AddParams
+
+
+def test_validate_parameters() -> None:
+    assert add.validate_parameters(arguments={"a": 1, "b": "2"}) == AddParams(a=1, b=2)
+
+    with pytest.raises(ValidationError):
+        add.validate_parameters(arguments={"a": 1})
+
+
+def test_rendered_schema_is_cached_and_copied() -> None:
+    llm_tool = add.as_llm_tool()
+
+    first = llm_tool.render()
+    first["function"]["parameters"].pop("properties")
+
+    assert llm_tool.render()["function"]["parameters"] == AddParams.model_json_schema()
+
+
+async def test_tool_call() -> None:
+    result = await add(context=None, parameters=AddParams(a=1, b=2), conversation=Conversation())
+
+    assert result.total == 3
+
+
+def test_missing_parameters_annotation_raises() -> None:
+    async def untyped(*, context: None, parameters, conversation: Conversation) -> AddResult:  # type: ignore
+        return AddResult(total=0)
+
+    with pytest.raises(TypeError):
+        Tool(untyped).parameters_model  # type: ignore